@@ -6,17 +6,23 @@ conversation using message history.
 
 Concepts covered:
   - ChatPromptTemplate with MessagesPlaceholder
-  - Manual conversation history management
-  - Multi-turn conversations
+  - RunnableWithMessageHistory with a persistent, per-session store
+  - Multi-turn conversations (that survive restarts!)
 """
 
+import os
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.runnables.history import RunnableWithMessageHistory
+
+from chat_history_store import ChatHistoryStore
 
 load_dotenv()
 
+# ─── Configuration ──────────────────────────────────────────
+HISTORY_PATH = os.path.join(os.path.dirname(__file__), "chat_history.jsonl")
+
 llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.7)
 
 # 1. Create a prompt that includes a placeholder for chat history
@@ -28,20 +34,24 @@ prompt = ChatPromptTemplate.from_messages([
 
 chain = prompt | llm
 
-# 2. Maintain conversation history as a list of messages
-chat_history = []
+# 2. Keep each conversation in a persistent, session-keyed store
+#    (only the last 20 messages of a session are sent to the LLM)
+store = ChatHistoryStore(HISTORY_PATH, window=20)
 
-def chat(user_input: str) -> str:
-    """Send a message and update the chat history."""
-    response = chain.invoke({
-        "chat_history": chat_history,
-        "input": user_input,
-    })
+chain_with_history = RunnableWithMessageHistory(
+    chain,
+    store.get_session_history,
+    input_messages_key="input",
+    history_messages_key="chat_history",
+)
 
-    # Add both the user message and AI response to history
-    chat_history.append(HumanMessage(content=user_input))
-    chat_history.append(AIMessage(content=response.content))
 
+def chat(user_input: str, session_id: str = "alex") -> str:
+    """Send a message; the store records both sides of the exchange."""
+    response = chain_with_history.invoke(
+        {"input": user_input},
+        config={"configurable": {"session_id": session_id}},
+    )
     return response.content
 
 
@@ -62,6 +72,14 @@ for msg in conversations:
     reply = chat(msg)
     print(f"🤖 Buddy: {reply}")
 
+# 4. A different session has its own, separate memory
+msg = "What's my name?"
+print(f"\n🧑 Guest: {msg}")
+print(f"🤖 Buddy: {chat(msg, session_id='guest')}")
+
 print("\n" + "=" * 60)
-print(f"📜 Total messages in history: {len(chat_history)}")
+print(f"📜 Messages stored for 'alex': {len(store.load('alex'))}")
+print(f"💾 History saved to: {os.path.basename(HISTORY_PATH)} "
+      f"({len(store.session_ids())} session(s))")
 print("=" * 60)
+store.close()
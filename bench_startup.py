@@ -0,0 +1,180 @@
+"""
+Startup Benchmark ⏱️
+====================
+Measures how long the RAG scripts take before you can type a question.
+
+Three measurements, each in a fresh Python process:
+  1. Import time of every heavy module the RAG scripts use
+  2. Time until the "❓ Your question:" prompt appears
+  3. Time until the RAG chain is ready to answer. rag_cli.py shows its
+     prompt before this; 07 and 09 build the chain before prompting,
+     so for them it equals the time to prompt.
+
+Usage:
+    python bench_startup.py                   # rag_cli.py only
+    python bench_startup.py --legacy          # also 07 and 09 (embeds the file!)
+    python bench_startup.py --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROMPT = "Your question:".encode("utf-8")
+HEAVY_MODULES = [
+    "dotenv",
+    "langchain_core.prompts",
+    "langchain_community.document_loaders",
+    "langchain_community.vectorstores",
+    "langchain_text_splitters",
+    "langchain_google_genai",
+    "langchain_groq",
+]
+
+
+def time_import(module):
+    """Seconds to import `module` in a fresh interpreter, or None if missing."""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip())
+
+
+def time_to_prompt(args, timeout=120):
+    """Seconds from process start until the question prompt is printed."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-u", *args],
+        cwd=HERE,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    prompted_at = []
+    done = threading.Event()
+
+    def read_until_prompt():
+        # os.read blocks, so it runs here and the deadline is enforced
+        # by done.wait() below
+        output = b""
+        while PROMPT not in output:
+            chunk = os.read(proc.stdout.fileno(), 4096)
+            if not chunk:  # exited before prompting
+                done.set()
+                return
+            output += chunk
+        prompted_at.append(time.perf_counter())
+        done.set()
+
+    reader = threading.Thread(target=read_until_prompt, daemon=True)
+    reader.start()
+    try:
+        done.wait(timeout)
+        return prompted_at[0] - start if prompted_at else None
+    finally:
+        proc.kill()  # also unblocks the reader with EOF
+        proc.wait()
+        reader.join()
+
+
+def time_to_ready(args, timeout=120):
+    """Seconds until `rag_cli.py --warmup-only` has built the chain."""
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            [sys.executable, *args, "--warmup-only"],
+            cwd=HERE,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    if result.returncode != 0:
+        return None
+    return time.perf_counter() - start
+
+
+def report(label, samples):
+    samples = [s for s in samples if s is not None]
+    if not samples:
+        print(f"   {label:<42} failed")
+        return
+    print(f"   {label:<42} median {statistics.median(samples) * 1000:8.1f} ms"
+          f"  (min {min(samples) * 1000:.1f}, n={len(samples)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RAG CLI startup")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=120,
+                        help="Seconds to wait for each prompt before giving up")
+    parser.add_argument("--legacy", action="store_true",
+                        help="Also time 07_interactive_rag.py and 09_groq_rag.py")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📦 Import time (fresh interpreter per run)")
+    print("=" * 60)
+    for module in HEAVY_MODULES:
+        report(module, [time_import(module) for _ in range(args.runs)])
+
+    # Build the index once up front, so the timed runs load the saved
+    # artifact instead of each starting (and abandoning) an embedding job
+    print("\n📂 Building the index once: rag_cli.py --build-index")
+    built = subprocess.run(
+        [sys.executable, "rag_cli.py", "--build-index"], cwd=HERE
+    ).returncode == 0
+
+    cli_targets = [
+        ("rag_cli.py", ["rag_cli.py"]),
+        ("rag_cli.py --provider groq", ["rag_cli.py", "--provider", "groq"]),
+    ]
+    legacy_targets = [
+        ("07_interactive_rag.py", ["07_interactive_rag.py"]),
+        ("09_groq_rag.py", ["09_groq_rag.py"]),
+    ]
+    if not built:
+        print("   Skipping rag_cli.py timings (no index artifact)")
+        cli_targets = []
+    if not args.legacy:
+        legacy_targets = []
+
+    prompt_times = {}
+    ready_times = {}
+    for label, script_args in cli_targets:
+        prompt_times[label] = [time_to_prompt(script_args, args.timeout)
+                               for _ in range(args.runs)]
+        ready_times[label] = [time_to_ready(script_args, args.timeout)
+                              for _ in range(args.runs)]
+    for label, script_args in legacy_targets:
+        # Each run embeds the whole file, so measure once and reuse it
+        prompt_times[label] = [time_to_prompt(script_args, args.timeout)
+                               for _ in range(args.runs)]
+        ready_times[label] = prompt_times[label]
+
+    print("\n" + "=" * 60)
+    print("⏱️  Time to first prompt")
+    print("=" * 60)
+    for label, samples in prompt_times.items():
+        report(label, samples)
+
+    print("\n" + "=" * 60)
+    print("🔥 Time until the chain can answer")
+    print("=" * 60)
+    for label, samples in ready_times.items():
+        report(label, samples)
+
+
+if __name__ == "__main__":
+    main()
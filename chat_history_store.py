@@ -0,0 +1,356 @@
+"""
+Chat History Store 🗄️
+=====================
+A persistent, session-keyed chat history backend for
+RunnableWithMessageHistory (used by 04_chains_and_memory.py).
+
+How it works:
+  - Every message is appended as one JSON line to a single log file
+  - An in-memory index keeps only the byte offsets of each session's
+    messages, never the messages themselves
+  - Reading the last N messages seeks straight to those N offsets
+  - Clearing a session appends a "clear" marker; the dead lines are
+    dropped later by a background compaction thread
+
+Usage:
+    store = ChatHistoryStore("chat_history.jsonl")
+    chain_with_history = RunnableWithMessageHistory(
+        chain,
+        store.get_session_history,
+        input_messages_key="input",
+        history_messages_key="chat_history",
+    )
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+
+class ChatHistoryStore:
+    """Append-only message log shared by many chat sessions."""
+
+    def __init__(
+        self,
+        path: str,
+        window: Optional[int] = 20,
+        compact_ratio: float = 0.5,
+        compact_min_bytes: int = 1024 * 1024,
+    ):
+        """
+        Args:
+            path: Log file to append to (created if missing).
+            window: How many recent messages a session loads into the
+                prompt. None loads the whole session.
+            compact_ratio: Start a background compaction once this share
+                of the file belongs to cleared sessions.
+            compact_min_bytes: Never compact files smaller than this.
+        """
+        self.path = path
+        self.window = window
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+
+        self._lock = threading.Lock()
+        self._compact_done = threading.Condition(self._lock)
+        self._index: Dict[str, List[int]] = {}
+        self._sizes: Dict[str, int] = {}  # bytes of each live session
+        self._live_bytes = 0
+        self._compacting = False
+        self._closed = False
+
+        # Left behind if the process died mid-compaction
+        if os.path.exists(self.path + ".compact"):
+            os.remove(self.path + ".compact")
+        self._rebuild_index()
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+
+    # ─── Public API ─────────────────────────────────────────
+    def get_session_history(self, session_id: str) -> "LogChatMessageHistory":
+        """Factory to pass to RunnableWithMessageHistory."""
+        return LogChatMessageHistory(self, session_id)
+
+    def append(self, session_id: str, messages: Sequence[BaseMessage]) -> None:
+        """Append messages to a session — O(1) per message."""
+        lines = [
+            self._encode({"session": session_id, "message": message_to_dict(m)})
+            for m in messages
+        ]
+        with self._lock:
+            offsets = self._index.setdefault(session_id, [])
+            offset = self._writer.tell()
+            for line in lines:
+                self._writer.write(line)
+                offsets.append(offset)
+                offset += len(line)
+            self._writer.flush()
+            added = sum(len(line) for line in lines)
+            self._sizes[session_id] = self._sizes.get(session_id, 0) + added
+            self._live_bytes += added
+
+    def load(self, session_id: str, last_n: Optional[int] = None) -> List[BaseMessage]:
+        """Return the last `last_n` messages of a session — O(last_n)."""
+        with self._lock:
+            offsets = self._index.get(session_id, [])
+            if last_n is not None:
+                offsets = offsets[-last_n:] if last_n > 0 else []
+            records = [self._read_record(self._reader, off) for off in offsets]
+        return messages_from_dict([r["message"] for r in records])
+
+    def clear(self, session_id: str) -> None:
+        """Forget a session. Its old lines are reclaimed by compaction."""
+        with self._lock:
+            if self._index.pop(session_id, None) is None:
+                return
+            self._live_bytes -= self._sizes.pop(session_id)
+            self._writer.write(self._encode({"session": session_id, "clear": True}))
+            self._writer.flush()
+            if self._should_compact():
+                # Claim the flag before releasing the lock, so a second
+                # clear() can't start another compaction
+                self._compacting = True
+                threading.Thread(target=self._compact, daemon=True).start()
+
+    def session_ids(self) -> List[str]:
+        """All sessions that currently have messages."""
+        with self._lock:
+            return list(self._index)
+
+    def compact(self) -> None:
+        """Rewrite the log so it only holds messages of live sessions.
+
+        Live lines are copied without holding the lock, so appends keep
+        flowing; only the lines written during the copy are replayed
+        under the lock before the new file replaces the old one.
+        """
+        with self._lock:
+            if self._compacting or self._closed:
+                return
+            self._compacting = True
+        self._compact()
+
+    def wait_for_compaction(self) -> None:
+        """Block until a running compaction has finished."""
+        with self._lock:
+            while self._compacting:
+                self._compact_done.wait()
+
+    def close(self) -> None:
+        """Finish any compaction and close the log file."""
+        with self._lock:
+            while self._compacting:
+                self._compact_done.wait()
+            self._closed = True
+            self._writer.close()
+            self._reader.close()
+
+    # ─── Internals ──────────────────────────────────────────
+    def _compact(self) -> None:
+        """compact() body; the caller has already set _compacting."""
+        tmp_path = self.path + ".compact"
+        try:
+            with self._lock:
+                snapshot = {sid: list(offs) for sid, offs in self._index.items()}
+                snapshot_end = self._writer.tell()
+
+            new_index: Dict[str, List[int]] = {}
+            new_sizes: Dict[str, int] = {}
+            with open(self.path, "rb") as old, open(tmp_path, "wb") as new:
+                # 1. Copy every live line that existed at snapshot time
+                for sid, offsets in snapshot.items():
+                    for off in offsets:
+                        old.seek(off)
+                        line = old.readline()
+                        new_index.setdefault(sid, []).append(new.tell())
+                        new_sizes[sid] = new_sizes.get(sid, 0) + len(line)
+                        new.write(line)
+
+                with self._lock:
+                    # 2. Replay whatever was appended while we were copying.
+                    #    Clear markers are kept: the new file may already hold
+                    #    lines of a session that was cleared during the copy.
+                    old.seek(snapshot_end)
+                    for line in old:
+                        record = json.loads(line)
+                        sid = record["session"]
+                        if record.get("clear"):
+                            new_index.pop(sid, None)
+                            new_sizes.pop(sid, None)
+                        else:
+                            new_index.setdefault(sid, []).append(new.tell())
+                            new_sizes[sid] = new_sizes.get(sid, 0) + len(line)
+                        new.write(line)
+                    new.flush()
+                    os.fsync(new.fileno())
+                    old.close()
+                    new.close()
+
+                    # 3. Swap the compacted file in
+                    self._writer.close()
+                    self._reader.close()
+                    try:
+                        os.replace(tmp_path, self.path)
+                        self._index = new_index
+                        self._sizes = new_sizes
+                        self._live_bytes = sum(new_sizes.values())
+                    finally:
+                        self._writer = open(self.path, "ab")
+                        self._reader = open(self.path, "rb")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with self._lock:
+                self._compacting = False
+                self._compact_done.notify_all()
+
+    @staticmethod
+    def _encode(record: dict) -> bytes:
+        return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    @staticmethod
+    def _read_record(handle, offset: int) -> dict:
+        handle.seek(offset)
+        return json.loads(handle.readline())
+
+    def _rebuild_index(self) -> None:
+        """Scan the log once at startup, keeping offsets only.
+
+        A half-written last line (e.g. the process was killed mid-write)
+        is truncated away. A corrupt line anywhere else is skipped, and
+        the records after it are kept; compaction drops it later.
+        """
+        if not os.path.exists(self.path):
+            return
+        offset = 0
+        with open(self.path, "rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):  # only ever the last line
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    offset += len(line)
+                    continue
+                sid = record["session"]
+                if record.get("clear"):
+                    self._index.pop(sid, None)
+                    self._sizes.pop(sid, None)
+                else:
+                    self._index.setdefault(sid, []).append(offset)
+                    self._sizes[sid] = self._sizes.get(sid, 0) + len(line)
+                offset += len(line)
+            size = handle.seek(0, os.SEEK_END)
+        if offset < size:
+            with open(self.path, "r+b") as handle:
+                handle.truncate(offset)
+        self._live_bytes = sum(self._sizes.values())
+
+    def _should_compact(self) -> bool:
+        size = self._writer.tell()
+        return (
+            not self._compacting
+            and size >= self.compact_min_bytes
+            and size - self._live_bytes >= size * self.compact_ratio
+        )
+
+
+class LogChatMessageHistory(BaseChatMessageHistory):
+    """One session's view of a ChatHistoryStore."""
+
+    def __init__(self, store: ChatHistoryStore, session_id: str):
+        self.store = store
+        self.session_id = session_id
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """The most recent `store.window` messages of this session."""
+        return self.store.load(self.session_id, self.store.window)
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        self.store.append(self.session_id, messages)
+
+    def clear(self) -> None:
+        self.store.clear(self.session_id)
+
+
+# ─── Self-check: python chat_history_store.py ───────────────
+if __name__ == "__main__":
+    import tempfile
+    from langchain_core.messages import HumanMessage
+
+    def message(i):
+        return [HumanMessage(content=f"message {i}")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1. Clear sessions while compactions run, then reopen the log:
+        #    every session ended with a clear, so nothing may come back.
+        path = os.path.join(tmp, "cleared.jsonl")
+        store = ChatHistoryStore(path, compact_min_bytes=0)
+
+        def worker(n):
+            for i in range(300):
+                store.append(f"s{n}", message(i))
+                if i % 50 == 49:
+                    store.clear(f"s{n}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        while any(t.is_alive() for t in threads):
+            store.compact()
+        for t in threads:
+            t.join()
+        store.close()
+
+        reopened = ChatHistoryStore(path)
+        leaked = {sid: len(reopened.load(sid)) for sid in reopened.session_ids()}
+        reopened.close()
+        assert not leaked, f"cleared sessions came back: {leaked}"
+        print("✅ Cleared sessions stay cleared after compaction and restart")
+
+        # 2. Many clears at once start one compaction, and close() waits for it
+        for trial in range(20):
+            path = os.path.join(tmp, f"close_{trial}.jsonl")
+            store = ChatHistoryStore(path, compact_min_bytes=0)
+            for n in range(16):
+                store.append(f"s{n}", message(n))
+            barrier = threading.Barrier(16)
+
+            def clear(n):
+                barrier.wait()
+                store.clear(f"s{n}")
+
+            threads = [threading.Thread(target=clear, args=(n,)) for n in range(16)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            store.close()
+            assert not store._compacting and store._writer.closed and store._reader.closed
+            assert not os.path.exists(path + ".compact")
+        print("✅ close() waits for a running compaction")
+
+        # 3. A corrupt line in the middle is skipped, not truncated away
+        path = os.path.join(tmp, "corrupt.jsonl")
+        store = ChatHistoryStore(path)
+        for i in range(5):
+            store.append("s", message(i))
+        store.close()
+        with open(path, "rb") as f:
+            lines = f.readlines()
+        lines[1] = b"{not json\n"
+        lines.append(b'{"session": "s", "mess')  # half-written last line
+        with open(path, "wb") as f:
+            f.writelines(lines)
+        reopened = ChatHistoryStore(path)
+        contents = [m.content for m in reopened.load("s")]
+        reopened.close()
+        assert contents == ["message 0", "message 2", "message 3", "message 4"], contents
+        with open(path, "rb") as f:
+            assert len(f.readlines()) == 5
+        print("✅ Corrupt lines are skipped and later records kept")
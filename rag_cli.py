@@ -0,0 +1,275 @@
+"""
+RAG CLI 🚀
+==========
+One entry point for the interactive RAG chats of 07 (Gemini) and
+09 (Groq) that shows the question prompt right away.
+
+Why it starts fast:
+  - Only the standard library is imported at module top; LangChain,
+    FAISS and the provider SDKs are imported inside the functions
+    that need them
+  - The FAISS index is saved once to a per-user cache and reloaded on
+    later runs, so the file is not split and embedded again on every start
+  - Loading the index and building the chain happen in a background
+    thread while you type your first question
+
+Usage:
+    python rag_cli.py                      # Gemini (gemma-3-27b-it)
+    python rag_cli.py --provider groq      # Groq (llama-3.3-70b-versatile)
+    python rag_cli.py --build-index        # (Re)build the index and exit
+    python rag_cli.py --file notes.txt     # Use your own .txt file
+    python rag_cli.py --warmup-only        # Build the chain and exit (benchmarks)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+
+# ─── Configuration ──────────────────────────────────────────
+FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "knowledge_base.txt")
+CACHE_DIR = os.path.join(
+    os.environ.get("LOCALAPPDATA")
+    or os.environ.get("XDG_CACHE_HOME")
+    or os.path.join(os.path.expanduser("~"), ".cache"),
+    "langchain_rag",
+)
+EMBEDDING_MODEL = "models/gemini-embedding-001"
+CHUNK_SIZE = 300
+CHUNK_OVERLAP = 50
+LLM_MODELS = {
+    "gemini": "gemma-3-27b-it",
+    "groq": "llama-3.3-70b-versatile",
+}
+INSTRUCTIONS = (
+    "You are a helpful assistant. Answer the question based ONLY "
+    "on the context provided below. If the context does not contain the "
+    "answer, say 'I don't have that information in the document.'\n\n"
+)
+
+
+# ─── Index artifact ─────────────────────────────────────────
+# Indexes live in CACHE_DIR, never next to the input file: FAISS
+# load_local() unpickles the docstore, so it must only ever read files
+# this tool wrote itself.
+def index_fingerprint(file_path):
+    """Everything that, if changed, makes a saved index stale."""
+    with open(file_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {
+        "file": os.path.basename(file_path),
+        "sha256": digest,
+        "embedding_model": EMBEDDING_MODEL,
+        "chunk_size": CHUNK_SIZE,
+        "chunk_overlap": CHUNK_OVERLAP,
+    }
+
+
+def default_index_dir(file_path, fingerprint):
+    """Cache folder for this exact file content and configuration."""
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    key = hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{stem}-{key[:16]}")
+
+
+def index_is_fresh(index_dir, fingerprint):
+    meta_path = os.path.join(index_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        return False
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):  # unreadable or half-written: rebuild
+        return False
+    return meta == fingerprint
+
+
+def build_index(file_path, index_dir, fingerprint):
+    """Load, split and embed `file_path`, then save the FAISS index.
+
+    `fingerprint` must be taken before the file is read, so an edit made
+    while embedding leaves the saved index looking stale, not fresh.
+    """
+    from langchain_community.document_loaders import TextLoader
+    from langchain_community.vectorstores import FAISS
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    documents = TextLoader(file_path, encoding="utf-8").load()
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=CHUNK_SIZE,
+        chunk_overlap=CHUNK_OVERLAP,
+        separators=["\n\n", "\n", ". ", " ", ""],
+    )
+    chunks = text_splitter.split_documents(documents)
+
+    embeddings = GoogleGenerativeAIEmbeddings(model=EMBEDDING_MODEL)
+    vector_store = FAISS.from_documents(chunks, embeddings)
+    os.makedirs(index_dir, mode=0o700, exist_ok=True)
+    vector_store.save_local(index_dir)
+    # Written last, so a half-saved index never looks fresh
+    with open(os.path.join(index_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(fingerprint, f, indent=2)
+    return vector_store, len(chunks)
+
+
+def load_index(file_path, index_dir=None):
+    """Reuse the saved index when it matches the file, else rebuild it."""
+    fingerprint = index_fingerprint(file_path)
+    index_dir = index_dir or default_index_dir(file_path, fingerprint)
+    if not index_is_fresh(index_dir, fingerprint):
+        return build_index(file_path, index_dir, fingerprint)[0]
+
+    from langchain_community.vectorstores import FAISS
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    embeddings = GoogleGenerativeAIEmbeddings(model=EMBEDDING_MODEL)
+    # meta.json only says whether the index is stale; it proves nothing
+    # about who wrote index.pkl. That is why index_dir defaults to our
+    # own cache folder (see CACHE_DIR above).
+    return FAISS.load_local(index_dir, embeddings, allow_dangerous_deserialization=True)
+
+
+# ─── RAG chain ──────────────────────────────────────────────
+def format_docs(docs):
+    """Join retrieved document chunks into a single string."""
+    return "\n\n---\n\n".join(doc.page_content for doc in docs)
+
+
+def build_rag_chain(provider, file_path, index_dir):
+    from dotenv import load_dotenv
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.runnables import RunnablePassthrough
+
+    load_dotenv()
+    retriever = load_index(file_path, index_dir).as_retriever(search_kwargs={"k": 3})
+
+    if provider == "groq":
+        from langchain_groq import ChatGroq
+
+        llm = ChatGroq(model=LLM_MODELS["groq"], temperature=0)
+        # LLaMA 3.3 supports system prompts!
+        rag_prompt = ChatPromptTemplate.from_messages([
+            ("system", INSTRUCTIONS + "Context:\n{context}"),
+            ("human", "{question}"),
+        ])
+    else:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        llm = ChatGoogleGenerativeAI(model=LLM_MODELS["gemini"], temperature=0)
+        # Gemma has no system prompt, so the instructions go in the human turn
+        rag_prompt = ChatPromptTemplate.from_messages([
+            ("human", INSTRUCTIONS + "Context:\n{context}\n\nQuestion: {question}"),
+        ])
+
+    return (
+        {"context": retriever | format_docs, "question": RunnablePassthrough()}
+        | rag_prompt
+        | llm
+        | StrOutputParser()
+    )
+
+
+class WarmUp:
+    """Builds the RAG chain in a background thread."""
+
+    def __init__(self, provider, file_path, index_dir):
+        self.chain = None
+        self.error = None
+        self._thread = threading.Thread(
+            target=self._run, args=(provider, file_path, index_dir), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, provider, file_path, index_dir):
+        try:
+            self.chain = build_rag_chain(provider, file_path, index_dir)
+        except Exception as e:  # re-raised in the main thread by get()
+            self.error = e
+
+    def get(self):
+        """Return the chain, waiting for the warm-up if it is still running."""
+        if self._thread.is_alive():
+            print("⏳ Still warming up...")
+            self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.chain
+
+
+# ─── Entry point ────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Interactive RAG chat over a .txt file")
+    parser.add_argument("--provider", choices=sorted(LLM_MODELS), default="gemini")
+    parser.add_argument("--file", default=FILE_PATH, help="Text file to chat about")
+    parser.add_argument("--index-dir",
+                        help="Where to save/load the FAISS index (only use a "
+                             "folder this tool created: loading it runs pickle)")
+    parser.add_argument("--build-index", action="store_true",
+                        help="Rebuild the index artifact and exit")
+    parser.add_argument("--warmup-only", action="store_true",
+                        help="Build the RAG chain, then exit (for benchmarks)")
+    args = parser.parse_args(argv)
+
+    file_path = os.path.abspath(args.file)
+    index_dir = args.index_dir
+
+    if args.build_index:
+        print(f"📂 Indexing: {os.path.basename(file_path)}")
+        try:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            fingerprint = index_fingerprint(file_path)
+            index_dir = index_dir or default_index_dir(file_path, fingerprint)
+            _, n_chunks = build_index(file_path, index_dir, fingerprint)
+        except Exception as e:
+            print(f"❌ Could not build the index: {type(e).__name__}: {e}")
+            return 1
+        print(f"✅ Saved {n_chunks} chunks to {index_dir}")
+        return
+
+    if args.warmup_only:
+        try:
+            build_rag_chain(args.provider, file_path, index_dir)
+        except Exception as e:
+            print(f"❌ Could not start the RAG chain: {type(e).__name__}: {e}")
+            return 1
+        print("✅ Chain ready")
+        return
+
+    warm_up = WarmUp(args.provider, file_path, index_dir)
+
+    print("=" * 60)
+    print(f"💬 RAG chat — {LLM_MODELS[args.provider]}")
+    print(f"📄 Document: {os.path.basename(file_path)}")
+    print("   Type 'quit' or 'exit' to stop")
+    print("=" * 60)
+
+    while True:
+        try:
+            question = input("\n❓ Your question: ").strip()
+        except (KeyboardInterrupt, EOFError):
+            print("\n👋 Bye!")
+            break
+
+        if not question:
+            continue
+        if question.lower() in ("quit", "exit", "q"):
+            print("👋 Bye!")
+            break
+
+        try:
+            rag_chain = warm_up.get()
+        except Exception as e:
+            print(f"❌ Could not start the RAG chain: {type(e).__name__}: {e}")
+            return 1
+
+        answer = rag_chain.invoke(question)
+        print(f"✅ {answer}")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())